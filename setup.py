@@ -23,6 +23,9 @@ setup(
     python_requires='>=3.12',
     install_requires=[
         'requests',
-        'aiohttp'
+        'aiohttp',
+        'cachetools',
+        'httpx[http2]',
+        'orjson'
     ],
 )
\ No newline at end of file
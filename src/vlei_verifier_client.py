@@ -1,31 +1,86 @@
-import json
+import asyncio
 import logging
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import aiohttp
+import cachetools
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Create a logger object.
+# Create a logger object. Handlers and levels are left to the application;
+# configuring them here would force stdout I/O on every request.
 logger = logging.getLogger(__name__)
 
-# Configure the logger to write messages to stdout.
-handler = logging.StreamHandler(sys.stdout)
-logger.addHandler(handler)
 
-# Set the log level to include all messages.
-logger.setLevel(logging.DEBUG)
+def configure_logging(level: int = logging.INFO, stream=None):
+    """
+    Opt-in helper that attaches a stream handler to the client logger.
+
+    Restores the old always-on behaviour for callers who want it, without the
+    import-time side effects of configuring logging at module scope.
+
+    Args:
+        level: The log level to set on the client logger. Defaults to logging.INFO.
+        stream: The stream to write to. Defaults to sys.stdout.
+    """
+    handler = logging.StreamHandler(stream or sys.stdout)
+    logger.addHandler(handler)
+    logger.setLevel(level)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VerifierResponse:
     code: int
     message: str
     body: dict
 
 
+def _parse(res) -> dict:
+    """Decodes a response body with orjson, which is several times faster than stdlib json."""
+    return orjson.loads(res.content)
+
+
+# Payload keys for /signature/verify/, hoisted out of the per-call hot path.
+_SIG_KEYS = ("signature", "signer_aid", "non_prefixed_digest")
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """
+    httpx transport that retries 502/503/504 responses with backoff.
+
+    httpx's built-in retries= only covers connect errors, so this adds the
+    status-based retry that the requests transport gets from urllib3's Retry.
+    """
+
+    _STATUS_FORCELIST = (502, 503, 504)
+
+    def __init__(self, total: int = 3, backoff_factor: float = 0.2, **kwargs):
+        super().__init__(**kwargs)
+        self._total = total
+        self._backoff_factor = backoff_factor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = super().handle_request(request)
+        for attempt in range(self._total):
+            if response.status_code not in self._STATUS_FORCELIST:
+                break
+            response.close()
+            time.sleep(self._backoff_factor * (2 ** attempt))
+            response = super().handle_request(request)
+        return response
+
+
 class _VerifierServiceAdapter:
-    def __init__(self, verifier_base_url: str = "http://localhost:7676"):
+    def __init__(self, verifier_base_url: str = "http://localhost:7676", transport: str = "httpx",
+                 timeout: tuple[float, float] = (3.05, 30)):
         self.verifier_base_url = verifier_base_url
+        self.transport = transport
 
         self.auths_url = f"{self.verifier_base_url}/authorizations/"
         self.presentations_url = f"{self.verifier_base_url}/presentations/"
@@ -35,141 +90,244 @@ class _VerifierServiceAdapter:
         self.verify_signature_url = f"{self.verifier_base_url}/signature/verify/"
         self.add_rot_url = f"{self.verifier_base_url}/root_of_trust/"
 
-    def authorization_request(self, aid: str, headers) -> requests.Response:
-        logger.info(f"Authorization request sent with: aid = {aid}")
-        res = requests.get(
-            f"{self.auths_url}{aid}", headers={"Content-Type": "application/json", **headers}
-        )
-        logger.info(f"Authorization status: {json.dumps(res.json())}")
+        # Shared header dicts so hot-path calls do not rebuild them per request.
+        self._json_headers = {"Content-Type": "application/json"}
+        self._cesr_headers = {"Content-Type": "application/json+cesr"}
+
+        # Persistent client: keep-alive avoids a fresh TCP+TLS handshake per
+        # call, and the default httpx transport multiplexes concurrent calls
+        # over a single HTTP/2 connection. transport="requests" keeps the
+        # HTTP/1.1 pooled session for callers that need it.
+        if transport == "httpx":
+            # http2/limits/retries live on the transport; httpx ignores the
+            # client-level equivalents once a transport is supplied.
+            self.session = httpx.Client(
+                headers=self._json_headers,
+                transport=_RetryTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                ),
+            )
+        elif transport == "requests":
+            self.session = requests.Session()
+            self.session.headers.update(self._json_headers)
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=("GET", "PUT", "POST"),
+                ),
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        else:
+            raise ValueError(f"Unknown transport: {transport}")
+        # httpx takes raw request bodies via content=, requests via data=.
+        self._body_kw = "content" if transport == "httpx" else "data"
+        # Bound every request so a hung verifier cannot block a worker forever;
+        # requests takes a (connect, read) tuple, httpx its own Timeout object.
+        if transport == "httpx":
+            self.timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        else:
+            self.timeout = timeout
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def authorization_request(self, aid: str, headers) -> requests.Response | httpx.Response:
+        logger.info("Authorization request sent with: aid = %s", aid)
+        res = self.session.get(self.auths_url + aid, headers=headers, timeout=self.timeout)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Authorization status: %s", res.text)
         return res
 
-    def presentation_request(self, said: str, vlei: str) -> requests.Response:
-        logger.info(f"Presentation request sent with: said = {said}")
-        res = requests.put(
-            f"{self.presentations_url}{said}",
-            headers={"Content-Type": "application/json+cesr"},
-            data=vlei,
+    def authorization_light_request(self, aid: str, headers) -> int:
+        logger.info("Authorization (light) request sent with: aid = %s", aid)
+        url = self.auths_url + aid
+        # Stream and close without reading: the status code arrives with the
+        # response headers, so the body is never downloaded or parsed.
+        if self.transport == "httpx":
+            with self.session.stream("GET", url, headers=headers, timeout=self.timeout) as res:
+                return res.status_code
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as res:
+            return res.status_code
+
+    def presentation_request(self, said: str, vlei: str) -> requests.Response | httpx.Response:
+        logger.info("Presentation request sent with: said = %s", said)
+        res = self.session.put(
+            self.presentations_url + said,
+            headers=self._cesr_headers,
+            timeout=self.timeout,
+            **{self._body_kw: vlei},
         )
-        logger.info(f"Presentation response for said = {said}:  {json.dumps(res.json())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Presentation response for said = %s:  %s", said, res.text)
         return res
 
-    def presentations_history_request(self, aid: str) -> requests.Response:
-        logger.info(f"Presentation history request sent with: aid = {aid}")
-        res = requests.get(f"{self.presentations_history_url}{aid}", headers={"Content-Type": "application/json"})
-        logger.info(f"Presentation history response for aid = {aid}:  {json.dumps(res.json())}")
+    def presentations_history_request(self, aid: str) -> requests.Response | httpx.Response:
+        logger.info("Presentation history request sent with: aid = %s", aid)
+        res = self.session.get(self.presentations_history_url + aid, timeout=self.timeout)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Presentation history response for aid = %s:  %s", aid, res.text)
         return res
 
-    def verify_signed_headers_request(self, aid, sig, ser) -> requests.Response:
+    def verify_signed_headers_request(self, aid, sig, ser) -> requests.Response | httpx.Response:
         logger.info(
-            f"Signed headers verification request sent with aid = {aid}, sig = {sig}, ser = {ser}"
+            "Signed headers verification request sent with aid = %s, sig = %s, ser = %s", aid, sig, ser
         )
-        res = requests.post(f"{self.verify_signed_headers_url}{aid}", params={"sig": sig, "data": ser})
-        logger.info(
-            f"Signed headers verification response for aid = {aid}, sig = {sig}, ser = {ser}:  {json.dumps(res.json())}")
+        res = self.session.post(
+            self.verify_signed_headers_url + aid, params={"sig": sig, "data": ser}, timeout=self.timeout)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Signed headers verification response for aid = %s, sig = %s, ser = %s:  %s", aid, sig, ser, res.text)
         return res
 
     def verify_signature_request(self, signature, submitter, digest):
         logger.info(
-            f"Signature verification request sent with signature = {signature}, submitter = {submitter}, digest = {digest}"
+            "Signature verification request sent with signature = %s, submitter = %s, digest = %s",
+            signature, submitter, digest,
         )
-        payload = {
-            "signature": signature,
-            "signer_aid": submitter,
-            "non_prefixed_digest": digest
-        }
-        res = requests.post(self.verify_signature_url, json=payload)
+        payload = dict(zip(_SIG_KEYS, (signature, submitter, digest)))
+        res = self.session.post(
+            self.verify_signature_url, timeout=self.timeout, **{self._body_kw: orjson.dumps(payload)})
         return res
 
-    def add_root_of_trust_request(self, aid, vlei, oobi) -> requests.Response:
-        logger.info(f"Add root of trust request send with: aid = {aid}, vlei = {vlei}, oobi = {oobi}")
+    def add_root_of_trust_request(self, aid, vlei, oobi) -> requests.Response | httpx.Response:
+        logger.info("Add root of trust request send with: aid = %s, vlei = %s, oobi = %s", aid, vlei, oobi)
         payload = {
             "vlei": vlei,
             "oobi": oobi
         }
-        res = requests.post(f"{self.add_rot_url}{aid}", headers={"Content-Type": "application/json"}, json=payload)
-        logger.info(
-            f"Add root of trust response for aid = {aid}, vlei = {vlei}, oobi = {oobi}:  {json.dumps(res.json())}")
+        res = self.session.post(
+            self.add_rot_url + aid, timeout=self.timeout, **{self._body_kw: orjson.dumps(payload)})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Add root of trust response for aid = %s, vlei = %s, oobi = %s:  %s", aid, vlei, oobi, res.text)
         return res
 
 
 class _AsyncVerifierServiceAdapter:
-    def __init__(self, verifier_base_url: str = "http://localhost:7676"):
+    def __init__(self, verifier_base_url: str = "http://localhost:7676",
+                 timeout: tuple[float, float] = (3.05, 30)):
         self.verifier_base_url = verifier_base_url
+        self.timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
 
         self.auths_url = f"{self.verifier_base_url}/authorizations/"
         self.presentations_url = f"{self.verifier_base_url}/presentations/"
+        self.presentations_history_url = f"{self.verifier_base_url}/presentations/history/"
         self.reports_url = f"{self.verifier_base_url}/reports/"
         self.verify_signed_headers_url = f"{self.verifier_base_url}/request/verify/"
         self.verify_signature_url = f"{self.verifier_base_url}/signature/verify/"
         self.add_rot_url = f"{self.verifier_base_url}/root_of_trust/"
 
+        # Shared header dicts so hot-path calls do not rebuild them per request.
+        self._json_headers = {"Content-Type": "application/json"}
+        self._cesr_headers = {"Content-Type": "application/json+cesr"}
+
+        # Created lazily so the adapter can be constructed outside an event loop.
+        self.session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                timeout=self.timeout,
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
     async def authorization_request(self, aid: str, headers) -> aiohttp.ClientResponse:
-        logger.info(f"Authorization request sent with: aid = {aid}")
-        url = f"{self.auths_url}{aid}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers={"Content-Type": "application/json", **headers}) as response:
-                data = await response.json()
-                logger.info(f"Authorization status: {json.dumps(data)}")
-                return response
+        logger.info("Authorization request sent with: aid = %s", aid)
+        url = self.auths_url + aid
+        session = self._get_session()
+        async with session.get(url, headers={**self._json_headers, **headers}) as response:
+            await response.read()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Authorization status: %s", await response.text())
+            return response
 
     async def presentation_request(self, said: str, vlei: str) -> aiohttp.ClientResponse:
-        logger.info(f"Presentation request sent with: said = {said}")
-        url = f"{self.presentations_url}{said}"
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url, headers={"Content-Type": "application/json+cesr"}, data=vlei) as response:
-                data = await response.json()
-                logger.info(f"Presentation response for said = {said}:  {json.dumps(data)}")
-                return response
+        logger.info("Presentation request sent with: said = %s", said)
+        url = self.presentations_url + said
+        session = self._get_session()
+        async with session.put(url, headers=self._cesr_headers, data=vlei) as response:
+            await response.read()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Presentation response for said = %s:  %s", said, await response.text())
+            return response
 
     async def presentations_history_request(self, aid: str) -> aiohttp.ClientResponse:
-        logger.info(f"Presentation history request sent with: aid = {aid}")
-        url = f"{self.verifier_base_url}{aid}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers={"Content-Type": "application/json"}) as response:
-                data = await response.json()
-                logger.info(f"Presentation history response for aid = {aid}:  {json.dumps(data)}")
-                return response
+        logger.info("Presentation history request sent with: aid = %s", aid)
+        url = self.presentations_history_url + aid
+        session = self._get_session()
+        async with session.get(url, headers=self._json_headers) as response:
+            await response.read()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Presentation history response for aid = %s:  %s", aid, await response.text())
+            return response
 
     async def verify_signed_headers_request(self, aid: str, sig: str, ser: str) -> aiohttp.ClientResponse:
         logger.info(
-            f"Signed headers verification request sent with aid = {aid}, sig = {sig}, ser = {ser}"
+            "Signed headers verification request sent with aid = %s, sig = %s, ser = %s", aid, sig, ser
         )
-        url = f"{self.verify_signed_headers_url}{aid}"
+        url = self.verify_signed_headers_url + aid
         params = {"sig": sig, "data": ser}
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, params=params) as response:
-                data = await response.json()
-                logger.info(
-                    f"Signed headers verification response for aid = {aid}, sig = {sig}, ser = {ser}:  {json.dumps(data)}")
-                return response
+        session = self._get_session()
+        async with session.post(url, params=params) as response:
+            await response.read()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Signed headers verification response for aid = %s, sig = %s, ser = %s:  %s",
+                    aid, sig, ser, await response.text())
+            return response
 
     async def verify_signature_request(self, signature: str, submitter: str, digest: str) -> aiohttp.ClientResponse:
         logger.info(
-            f"Signature verification request sent with signature = {signature}, submitter = {submitter}, digest = {digest}"
+            "Signature verification request sent with signature = %s, submitter = %s, digest = %s",
+            signature, submitter, digest,
         )
         url = self.verify_signature_url
-        payload = {
-            "signature": signature,
-            "signer_aid": submitter,
-            "non_prefixed_digest": digest
-        }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                return response
+        payload = dict(zip(_SIG_KEYS, (signature, submitter, digest)))
+        session = self._get_session()
+        async with session.post(url, data=orjson.dumps(payload), headers=self._json_headers) as response:
+            await response.read()
+            return response
 
     async def add_root_of_trust_request(self, aid: str, vlei: str, oobi: str) -> aiohttp.ClientResponse:
-        logger.info(f"Add root of trust request sent with: aid = {aid}, vlei = {vlei}, oobi = {oobi}")
-        url = f"{self.add_rot_url}{aid}"
+        logger.info("Add root of trust request sent with: aid = %s, vlei = %s, oobi = %s", aid, vlei, oobi)
+        url = self.add_rot_url + aid
         payload = {
             "vlei": vlei,
             "oobi": oobi
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers={"Content-Type": "application/json"}, json=payload) as response:
-                data = await response.json()
-                logger.info(
-                    f"Add root of trust response for aid = {aid}, vlei = {vlei}, oobi = {oobi}:  {json.dumps(data)}")
-                return response
+        session = self._get_session()
+        async with session.post(url, data=orjson.dumps(payload), headers=self._json_headers) as response:
+            await response.read()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Add root of trust response for aid = %s, vlei = %s, oobi = %s:  %s",
+                    aid, vlei, oobi, await response.text())
+            return response
 
 
 class VerifierClient:
@@ -182,15 +340,62 @@ class VerifierClient:
         verifier_service_adapter (_VerifierServiceAdapter): Adapter for interacting with the Verifier service.
     """
 
-    def __init__(self, verifier_base_url: str = "http://localhost:7676"):
+    def __init__(self, verifier_base_url: str = "http://localhost:7676", cache_enabled: bool = True,
+                 transport: str = "httpx", raise_on_error: bool = False,
+                 timeout: tuple[float, float] = (3.05, 30)):
         """
         Initializes the VerifierClient with a specified base URL.
 
         Args:
             verifier_base_url (str): The base URL of the vlei-verifier service. Defaults to "http://localhost:7676".
+            cache_enabled (bool): Whether successful verification results are cached client-side. Defaults to True.
+            transport (str): The HTTP transport, "httpx" (HTTP/2) or "requests" (HTTP/1.1). Defaults to "httpx".
+            raise_on_error (bool): Whether 4xx/5xx responses raise instead of being parsed. Defaults to False.
+            timeout (tuple[float, float]): Per-request (connect, read) timeout in seconds. Defaults to (3.05, 30).
         """
         self.verifier_base_url = verifier_base_url
-        self.verifier_service_adapter = _VerifierServiceAdapter(self.verifier_base_url)
+        self.timeout = timeout
+        self.verifier_service_adapter = _VerifierServiceAdapter(
+            self.verifier_base_url, transport=transport, timeout=timeout)
+        self.cache_enabled = cache_enabled
+        self.raise_on_error = raise_on_error
+        # Signature outcomes are deterministic for identical inputs, so they can
+        # be memoized indefinitely; authorization state can expire, so it only
+        # gets a short TTL.
+        self._sig_cache = cachetools.LRUCache(maxsize=4096)
+        self._headers_cache = cachetools.LRUCache(maxsize=4096)
+        self._auth_cache = cachetools.TTLCache(maxsize=1024, ttl=30)
+        # cachetools containers are not thread-safe; the _many methods hit
+        # these caches from worker threads.
+        self._cache_lock = threading.Lock()
+
+    def _to_response(self, res) -> VerifierResponse:
+        """Converts an HTTP response into a VerifierResponse, parsing the body exactly once."""
+        if self.raise_on_error:
+            res.raise_for_status()
+        body = _parse(res)
+        return VerifierResponse(
+            code=res.status_code,
+            body=body,
+            message=body.get("msg", ""),
+        )
+
+    def clear_cache(self):
+        """Drops all cached verification and authorization results."""
+        with self._cache_lock:
+            self._sig_cache.clear()
+            self._headers_cache.clear()
+            self._auth_cache.clear()
+
+    def close(self):
+        """Releases the pooled connections held by the underlying session."""
+        self.verifier_service_adapter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def authorization(self, aid: str, headers: dict[str, str] = None) -> VerifierResponse:
         """
@@ -206,14 +411,40 @@ class VerifierClient:
             message: The response message from the Verifier service.
         """
         headers = headers or {}
+        cache_key = (aid, tuple(sorted(headers.items())))
+        if self.cache_enabled:
+            with self._cache_lock:
+                cached = self._auth_cache.get(cache_key)
+            if cached is not None:
+                return cached
         res = self.verifier_service_adapter.authorization_request(aid, headers)
-        response = VerifierResponse(
-            code=res.status_code,
-            body=res.json(),
-            message=res.json()["msg"],
-        )
+        response = self._to_response(res)
+        if self.cache_enabled and response.code == 200:
+            with self._cache_lock:
+                self._auth_cache[cache_key] = response
         return response
 
+    def authorization_light(self, aid: str, headers: dict[str, str] = None) -> VerifierResponse:
+        """
+        Checks if the provided AID is authorized without downloading the response body.
+
+        Useful for bulk status polling where only the response code matters: the
+        connection is closed as soon as the headers arrive, so large bodies are
+        never transferred or parsed.
+
+        Args:
+            aid (str): AID to check.
+            headers: Signed headers.
+
+        Returns:
+            code: The response code from the Verifier service.
+            body: Always an empty dict; the body is not read.
+            message: Always an empty string; the body is not read.
+        """
+        headers = headers or {}
+        code = self.verifier_service_adapter.authorization_light_request(aid, headers)
+        return VerifierResponse(code=code, body={}, message="")
+
     def presentation(self, said: str, vlei: str) -> VerifierResponse:
         """
         Submits a presentation request to log in using vLEI credentials.
@@ -228,21 +459,24 @@ class VerifierClient:
             message: The response message from the Verifier service.
         """
         res = self.verifier_service_adapter.presentation_request(said, vlei)
-        response = VerifierResponse(
-            code=res.status_code,
-            body=res.json(),
-            message=res.json()["msg"],
-        )
-        return response
+        return self._to_response(res)
+
+    def presentation_many(self, items: list[tuple[str, str]]) -> list[VerifierResponse]:
+        """
+        Submits many presentation requests concurrently over the pooled session.
+
+        Args:
+            items: A list of (said, vlei) tuples.
+
+        Returns:
+            A list of VerifierResponse objects, in the same order as the input items.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(lambda item: self.presentation(*item), items))
 
     def get_presentations_history(self, aid: str) -> VerifierResponse:
         res = self.verifier_service_adapter.presentations_history_request(aid)
-        response = VerifierResponse(
-            code=res.status_code,
-            body=res.json(),
-            message=res.json()["msg"],
-        )
-        return response
+        return self._to_response(res)
 
     def verify_signed_headers(self, aid: str, sig: str, ser: str) -> VerifierResponse:
         """
@@ -258,14 +492,32 @@ class VerifierClient:
             body: The JSON response from the Verifier service.
             message: The response message from the Verifier service.
         """
+        cache_key = (aid, sig, ser)
+        if self.cache_enabled:
+            with self._cache_lock:
+                cached = self._headers_cache.get(cache_key)
+            if cached is not None:
+                return cached
         res = self.verifier_service_adapter.verify_signed_headers_request(aid, sig, ser)
-        response = VerifierResponse(
-            code=res.status_code,
-            body=res.json(),
-            message=res.json()["msg"],
-        )
+        response = self._to_response(res)
+        if self.cache_enabled and response.code == 200:
+            with self._cache_lock:
+                self._headers_cache[cache_key] = response
         return response
 
+    def verify_signed_headers_many(self, items: list[tuple[str, str, str]]) -> list[VerifierResponse]:
+        """
+        Verifies many sets of signed headers concurrently over the pooled session.
+
+        Args:
+            items: A list of (aid, sig, ser) tuples.
+
+        Returns:
+            A list of VerifierResponse objects, in the same order as the input items.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(lambda item: self.verify_signed_headers(*item), items))
+
     def add_root_of_trust(self, aid: str, vlei: str, oobi: str) -> VerifierResponse:
         """
         Adds a root of trust to the Verifier.
@@ -281,12 +533,7 @@ class VerifierClient:
             message: The response message from the Verifier service.
         """
         res = self.verifier_service_adapter.add_root_of_trust_request(aid, vlei, oobi)
-        response = VerifierResponse(
-            code=res.status_code,
-            body=res.json(),
-            message=res.json()["msg"],
-        )
-        return response
+        return self._to_response(res)
 
     def verify_signature(self, signature: str, signer_aid: str, non_prefixed_digest: str) -> VerifierResponse:
         """
@@ -302,14 +549,38 @@ class VerifierClient:
             body: The JSON response from the Verifier service.
             message: The response message from the Verifier service.
         """
+        cache_key = (signature, signer_aid, non_prefixed_digest)
+        if self.cache_enabled:
+            with self._cache_lock:
+                cached = self._sig_cache.get(cache_key)
+            if cached is not None:
+                return cached
         res = self.verifier_service_adapter.verify_signature_request(signature, signer_aid, non_prefixed_digest)
-        response = VerifierResponse(
-            code=res.status_code,
-            body=res.json(),
-            message=res.json()["msg"],
-        )
+        response = self._to_response(res)
+        if self.cache_enabled and response.code == 200:
+            with self._cache_lock:
+                self._sig_cache[cache_key] = response
         return response
 
+    def verify_signatures_bulk_sync(
+            self, items: list[tuple[str, str, str]]
+    ) -> list[VerifierResponse]:
+        """
+        Verifies many signatures concurrently by running the async client under the hood.
+
+        Args:
+            items: A list of (signature, signer_aid, non_prefixed_digest) tuples.
+
+        Returns:
+            A list of VerifierResponse objects, in the same order as the input items.
+        """
+
+        async def _run() -> list[VerifierResponse]:
+            async with AsyncVerifierClient(self.verifier_base_url, timeout=self.timeout) as client:
+                return await client.verify_signatures_bulk(items)
+
+        return asyncio.run(_run())
+
 
 class AsyncVerifierClient:
     """
@@ -321,15 +592,28 @@ class AsyncVerifierClient:
         verifier_service_adapter (_AsyncVerifierServiceAdapter): Adapter for interacting with the Verifier service asynchronously.
     """
 
-    def __init__(self, verifier_base_url: str = "http://localhost:7676"):
+    def __init__(self, verifier_base_url: str = "http://localhost:7676",
+                 timeout: tuple[float, float] = (3.05, 30)):
         """
         Initializes the AsyncVerifierClient with a specified base URL.
 
         Args:
             verifier_base_url (str): The base URL of the vlei-verifier service. Defaults to "http://localhost:7676".
+            timeout (tuple[float, float]): Per-request (connect, read) timeout in seconds. Defaults to (3.05, 30).
         """
         self.verifier_base_url = verifier_base_url
-        self.verifier_service_adapter = _AsyncVerifierServiceAdapter(self.verifier_base_url)
+        self.verifier_service_adapter = _AsyncVerifierServiceAdapter(self.verifier_base_url, timeout=timeout)
+
+    async def close(self):
+        """Closes the shared aiohttp session held by the underlying adapter."""
+        await self.verifier_service_adapter.close()
+
+    async def __aenter__(self):
+        await self.verifier_service_adapter.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
     async def authorization(self, aid: str, headers: dict[str, str] = None) -> VerifierResponse:
         """
@@ -346,11 +630,11 @@ class AsyncVerifierClient:
         """
         headers = headers or {}
         res = await self.verifier_service_adapter.authorization_request(aid, headers)
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         return VerifierResponse(
             code=res.status,
             body=data,
-            message=data["msg"],
+            message=data.get("msg", ""),
         )
 
     async def presentation(self, said: str, vlei: str) -> VerifierResponse:
@@ -367,20 +651,20 @@ class AsyncVerifierClient:
             message: The response message from the Verifier service.
         """
         res = await self.verifier_service_adapter.presentation_request(said, vlei)
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         return VerifierResponse(
             code=res.status,
             body=data,
-            message=data["msg"],
+            message=data.get("msg", ""),
         )
 
     async def get_presentations_history(self, aid) -> VerifierResponse:
         res = await self.verifier_service_adapter.presentations_history_request(aid)
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         return VerifierResponse(
             code=res.status,
             body=data,
-            message=data["msg"],
+            message=data.get("msg", ""),
         )
 
     async def verify_signed_headers(self, aid: str, sig: str, ser: str) -> VerifierResponse:
@@ -398,11 +682,11 @@ class AsyncVerifierClient:
             message: The response message from the Verifier service.
         """
         res = await self.verifier_service_adapter.verify_signed_headers_request(aid, sig, ser)
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         return VerifierResponse(
             code=res.status,
             body=data,
-            message=data["msg"],
+            message=data.get("msg", ""),
         )
 
     async def add_root_of_trust(self, aid: str, vlei: str, oobi: str) -> VerifierResponse:
@@ -420,11 +704,11 @@ class AsyncVerifierClient:
             message: The response message from the Verifier service.
         """
         res = await self.verifier_service_adapter.add_root_of_trust_request(aid, vlei, oobi)
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         return VerifierResponse(
             code=res.status,
             body=data,
-            message=data["msg"],
+            message=data.get("msg", ""),
         )
 
     async def verify_signature(self, signature: str, signer_aid: str, non_prefixed_digest: str) -> VerifierResponse:
@@ -442,9 +726,23 @@ class AsyncVerifierClient:
             message: The response message from the Verifier service.
         """
         res = await self.verifier_service_adapter.verify_signature_request(signature, signer_aid, non_prefixed_digest)
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         return VerifierResponse(
             code=res.status,
             body=data,
-            message=data["msg"],
-        )
\ No newline at end of file
+            message=data.get("msg", ""),
+        )
+
+    async def verify_signatures_bulk(
+            self, items: list[tuple[str, str, str]]
+    ) -> list[VerifierResponse]:
+        """
+        Asynchronously verifies many signatures concurrently over the shared session.
+
+        Args:
+            items: A list of (signature, signer_aid, non_prefixed_digest) tuples.
+
+        Returns:
+            A list of VerifierResponse objects, in the same order as the input items.
+        """
+        return list(await asyncio.gather(*(self.verify_signature(*item) for item in items)))
\ No newline at end of file